@@ -1,14 +1,16 @@
 import serial.tools.list_ports
 
+# ListPortInfo exposes a fixed schema; an explicit tuple avoids walking
+# dir(port) and filtering out methods on every port
+_FIELDS = ("device", "name", "description", "hwid", "vid", "pid",
+           "serial_number", "location", "manufacturer", "product", "interface")
+
 # Get all available ports with detailed information
 ports = list(serial.tools.list_ports.comports())
 
 for port in ports:
     if "STM32" in port.description:
-        print (port)
-        
-        # Print all available attributes
-        for attr in dir(port):
-            if not attr.startswith('_') and not callable(getattr(port, attr)):
-                print(f"  {attr}: {getattr(port, attr)}")
-        print()
\ No newline at end of file
+        # One print per port instead of one per attribute
+        lines = [str(port)]
+        lines.extend(f"  {f}: {getattr(port, f, None)}" for f in _FIELDS)
+        print("\n".join(lines) + "\n")
@@ -3,18 +3,282 @@
 # This script is used to parse the output of the ioreg command and extract information about USB interfaces.
 # It can be used to list all USB interfaces, or to find the TTY device for a specific interface.
 
+import base64
+import datetime
+import io
 import plistlib
+import shutil
 import subprocess
 import json
+import operator
 import os
 import sys
+import tempfile
+import time
 import argparse
+from collections import ChainMap, deque, namedtuple
 
-def get_usb_interfaces():
-    # Option 1: Get data from ioreg command
+# lxml parses XML in C (libxml2) and is noticeably faster than plistlib's
+# pure-Python expat reader on large ioreg dumps; fall back to plistlib if
+# it is not installed.
+try:
+    from lxml import etree as _etree
+except ImportError:
+    _etree = None
+
+# Hot plist keys, interned once so the traversal's dict lookups hit the
+# pointer-equality fast path instead of re-hashing a fresh string object
+# for every .get()
+_K_NAME = sys.intern('IORegistryEntryName')
+_K_CHILDREN = sys.intern('IORegistryEntryChildren')
+_K_CLASS = sys.intern('bInterfaceClass')
+_K_IOCLASS = sys.intern('IOClass')
+_K_TTY = sys.intern('IOTTYDevice')
+
+# IOKit functions we bind from the framework bundle via pyobjc. Talking to
+# IOKit directly skips the ioreg fork/exec and the XML plist round-trip;
+# the registry comes back as native dicts instead.
+_IOKIT_FUNCTIONS = [
+    ("IOServiceMatching", b"@*"),
+    ("IOServiceGetMatchingServices", b"iI@o^I"),
+    ("IOIteratorNext", b"II"),
+    ("IORegistryEntryCreateCFProperties", b"iIo^@@I"),
+    ("IORegistryEntryGetChildIterator", b"iI*o^I"),
+    ("IORegistryEntryGetName", b"iIo^[128c]"),
+    ("IOObjectRelease", b"iI"),
+]
+
+def _load_iokit():
+    # Bind the IOKit C functions into a namespace dict. Raises ImportError
+    # if pyobjc is not available (e.g. not running on macOS).
+    import objc
+    from Foundation import NSBundle
+
+    bundle = NSBundle.bundleWithIdentifier_("com.apple.framework.IOKit")
+    iokit = {}
+    objc.loadBundleFunctions(bundle, iokit, _IOKIT_FUNCTIONS)
+    return iokit
+
+def _registry_entry_to_dict(iokit, entry):
+    # Build a dict shaped like one ioreg -a plist entry: the entry's
+    # properties plus its name and a recursively built
+    # 'IORegistryEntryChildren' list, so the consumers below need no changes.
+    err, props = iokit["IORegistryEntryCreateCFProperties"](entry, None, None, 0)
+    node = dict(props) if err == 0 and props is not None else {}
+
+    err, name = iokit["IORegistryEntryGetName"](entry, None)
+    if err == 0 and name:
+        node[_K_NAME] = name.decode('utf-8', 'replace').rstrip('\x00')
+
+    err, child_iter = iokit["IORegistryEntryGetChildIterator"](entry, b"IOService", None)
+    if err == 0:
+        children = []
+        child = iokit["IOIteratorNext"](child_iter)
+        while child:
+            children.append(_registry_entry_to_dict(iokit, child))
+            iokit["IOObjectRelease"](child)
+            child = iokit["IOIteratorNext"](child_iter)
+        iokit["IOObjectRelease"](child_iter)
+        if children:
+            node[_K_CHILDREN] = children
+    return node
+
+def _get_usb_interfaces_iokit(cdc_only=False):
+    # Query the IO registry in-process instead of spawning ioreg.
+    iokit = _load_iokit()
+    matching = iokit["IOServiceMatching"](b"IOUSBHostInterface")
+    if cdc_only:
+        # Let the kernel hand back only CDC data interfaces (class 10)
+        # instead of parsing every interface and discarding most of them
+        matching["bInterfaceClass"] = 10
+    err, iterator = iokit["IOServiceGetMatchingServices"](0, matching, None)
+    if err != 0:
+        raise OSError(f"IOServiceGetMatchingServices failed: {err}")
+
+    pl = []
+    service = iokit["IOIteratorNext"](iterator)
+    while service:
+        pl.append(_registry_entry_to_dict(iokit, service))
+        iokit["IOObjectRelease"](service)
+        service = iokit["IOIteratorNext"](iterator)
+    iokit["IOObjectRelease"](iterator)
+    return pl
+
+def _lxml_plist_parse(source):
+    """Parse an XML plist from a file-like object with lxml, building the
+    same dict/list tree as plistlib via a small stack machine over
+    iterparse events. Parsing is incremental, so the source can be a pipe
+    that is still being written."""
+    root = None
+    stack = []       # open <dict>/<array> containers
+    key_stack = []   # pending <key> text for each open <dict>
+
+    def attach(value):
+        nonlocal root
+        if not stack:
+            root = value
+        elif type(stack[-1]) is list:
+            stack[-1].append(value)
+        else:
+            stack[-1][key_stack.pop()] = value
+
+    for event, elem in _etree.iterparse(source, events=("start", "end")):
+        tag = elem.tag
+        if event == "start":
+            if tag == "dict":
+                container = {}
+                attach(container)
+                stack.append(container)
+            elif tag == "array":
+                container = []
+                attach(container)
+                stack.append(container)
+            continue
+        # end events
+        if tag in ("dict", "array"):
+            stack.pop()
+        elif tag == "key":
+            key_stack.append(sys.intern(elem.text or ""))
+        elif tag == "string":
+            attach(elem.text or "")
+        elif tag == "integer":
+            attach(int(elem.text))
+        elif tag == "real":
+            attach(float(elem.text))
+        elif tag == "true":
+            attach(True)
+        elif tag == "false":
+            attach(False)
+        elif tag == "data":
+            attach(base64.b64decode(elem.text or ""))
+        elif tag == "date":
+            attach(datetime.datetime.strptime(elem.text, "%Y-%m-%dT%H:%M:%SZ"))
+        elem.clear()
+    return root if root is not None else []
+
+def _plist_loads(data):
+    # Prefer the lxml reader; plistlib is the fallback
+    if _etree is not None:
+        return _lxml_plist_parse(io.BytesIO(data))
+    return plistlib.loads(data, fmt=plistlib.FMT_XML)
+
+# ioreg output cache. USB topology rarely changes within a few seconds,
+# so back-to-back queries can reuse the previous dump instead of paying
+# the fork/exec and ioreg's kernel walk again.
+_IOREG_CMD = ["ioreg", "-arlw0", "-c", "IOUSBHostInterface"]
+# plutil converts the XML dump to binary plist on the fly; plistlib's
+# binary reader is several times faster than any XML parse
+_PLUTIL_CMD = ["plutil", "-convert", "binary1", "-o", "-", "-"]
+_IOREG_CACHE_FILE = os.path.join(tempfile.gettempdir(), "_ioreg_usbhostif.plist")
+_IOREG_CACHE_TTL = 5.0
+_ioreg_cache_stats = {"hits": 0, "misses": 0}
+
+def _spawn_ioreg_binary():
+    """Start ioreg piped through plutil so the dump arrives as a binary
+    plist. Raises FileNotFoundError if plutil is not available."""
+    p1 = subprocess.Popen(_IOREG_CMD, stdout=subprocess.PIPE, bufsize=1 << 20)
     try:
-        output = subprocess.check_output(["ioreg", "-arlw0", "-c", "IOUSBHostInterface"])
-        pl = plistlib.loads(output, fmt=plistlib.FMT_XML)
+        p2 = subprocess.Popen(_PLUTIL_CMD, stdin=p1.stdout,
+                              stdout=subprocess.PIPE, bufsize=1 << 20)
+    except FileNotFoundError:
+        p1.kill()
+        p1.wait()
+        raise
+    # Drop our handle so ioreg sees a broken pipe if plutil dies
+    p1.stdout.close()
+    return p1, p2
+
+def _load_plist_file(f):
+    # The cache may hold either format, depending on whether plutil was
+    # available when it was written; sniff the header
+    header = f.read(8)
+    f.seek(0)
+    if header.startswith(b'bplist'):
+        return plistlib.load(f, fmt=plistlib.FMT_BINARY)
+    if _etree is not None:
+        return _lxml_plist_parse(f)
+    return plistlib.load(f)
+
+def _cached_ioreg(ttl=_IOREG_CACHE_TTL):
+    """Return the path of a cached ioreg dump, re-running ioreg only when
+    the cached file is older than ttl seconds"""
+    try:
+        if time.time() - os.stat(_IOREG_CACHE_FILE).st_mtime < ttl:
+            _ioreg_cache_stats["hits"] += 1
+            return _IOREG_CACHE_FILE
+    except OSError:
+        pass
+
+    _ioreg_cache_stats["misses"] += 1
+    tmp_path = f"{_IOREG_CACHE_FILE}.{os.getpid()}.tmp"
+    try:
+        p1, p2 = _spawn_ioreg_binary()
+    except FileNotFoundError:
+        p1 = None
+        p2 = subprocess.Popen(_IOREG_CMD, stdout=subprocess.PIPE, bufsize=1 << 20)
+    try:
+        with io.open(tmp_path, 'wb') as f:
+            shutil.copyfileobj(p2.stdout, f)
+    finally:
+        p2.stdout.close()
+        returncode = p2.wait()
+        if p1 is not None:
+            returncode = p1.wait() or returncode
+    if returncode != 0:
+        os.unlink(tmp_path)
+        raise subprocess.CalledProcessError(returncode, "ioreg")
+    # Atomic rename so concurrent readers never see a partial dump
+    os.replace(tmp_path, _IOREG_CACHE_FILE)
+    return _IOREG_CACHE_FILE
+
+def get_usb_interfaces(use_cache=True, cdc_only=False):
+    # Option 1a: Query IOKit directly via pyobjc (no subprocess, no XML).
+    # For targeted TTY lookups the matching dict filters to CDC data
+    # interfaces kernel-side; the list-all path fetches everything.
+    try:
+        return _get_usb_interfaces_iokit(cdc_only=cdc_only)
+    except ImportError:
+        pass  # pyobjc not installed, fall back to the ioreg command
+    except Exception as e:
+        print(f"Error getting data from IOKit: {e}")
+
+    # Option 1b: Run ioreg. With the cache the dump lands in a TTL-guarded
+    # temp file that later calls reuse; with --no-cache the output goes
+    # straight into the parser, as binary plist when plutil is available.
+    try:
+        if use_cache:
+            path = _cached_ioreg()
+            with io.open(path, 'rb') as f:
+                return _load_plist_file(f)
+
+        try:
+            p1, p2 = _spawn_ioreg_binary()
+        except FileNotFoundError:
+            p1 = p2 = None  # no plutil; stream the XML instead
+
+        if p2 is not None:
+            # Binary plists index from the tail, so read the pipe whole
+            try:
+                data = p2.stdout.read()
+            finally:
+                p2.stdout.close()
+                returncode = p2.wait()
+                returncode = p1.wait() or returncode
+            if returncode != 0:
+                raise subprocess.CalledProcessError(returncode, "ioreg | plutil")
+            return plistlib.loads(data, fmt=plistlib.FMT_BINARY)
+
+        proc = subprocess.Popen(_IOREG_CMD, stdout=subprocess.PIPE, bufsize=1 << 20)
+        try:
+            if _etree is not None:
+                pl = _lxml_plist_parse(proc.stdout)
+            else:
+                pl = plistlib.loads(proc.stdout.read(), fmt=plistlib.FMT_XML)
+        finally:
+            proc.stdout.close()
+            returncode = proc.wait()
+        if returncode != 0:
+            raise subprocess.CalledProcessError(returncode, "ioreg")
         return pl
     except Exception as e:
         print(f"Error getting data from ioreg: {e}")
@@ -23,140 +287,200 @@ def get_usb_interfaces():
 def load_from_file(file_path):
     # Option 2: Load from XML file
     try:
-        with open(file_path, 'rb') as f:
-            pl = plistlib.load(f)
+        with io.open(file_path, 'rb') as f:
+            pl = _plist_loads(f.read())
             return pl
     except Exception as e:
         print(f"Error loading file {file_path}: {e}")
         return []
 
 def traverse_plist(pl, level=0):
-    """Recursively traverse a plist structure"""
-    indent = "  " * level
-    
-    if isinstance(pl, dict):
-        for key, value in pl.items():
-            if isinstance(value, (dict, list)):
-                print(f"{indent}{key}:")
-                traverse_plist(value, level + 1)
-            else:
-                print(f"{indent}{key}: {value}")
-    elif isinstance(pl, list):
-        print(f"{indent}List with {len(pl)} items:")
-        for i, item in enumerate(pl):
-            print(f"{indent}Item {i+1}:")
-            traverse_plist(item, level + 1)
-    else:
-        print(f"{indent}{pl}")
+    """Traverse a plist structure with an explicit stack (no recursion,
+    so deep ioreg trees cannot hit the recursion limit)"""
+    # Entries are either ("emit", line) or ("node", node, level); children
+    # are pushed in reverse so pops preserve the original output order.
+    # Lines are buffered and flushed in one write; dozens of print calls
+    # each take the stdout lock and may flush when piped
+    buf = []
+    stack = deque([("node", pl, level)])
+    while stack:
+        entry = stack.pop()
+        if entry[0] == "emit":
+            buf.append(entry[1])
+            continue
+        _, node, level = entry
+        indent = "  " * level
+        if type(node) is dict:
+            for key, value in reversed(list(node.items())):
+                if type(value) in (dict, list):
+                    stack.append(("node", value, level + 1))
+                    stack.append(("emit", f"{indent}{key}:"))
+                else:
+                    stack.append(("emit", f"{indent}{key}: {value}"))
+        elif type(node) is list:
+            buf.append(f"{indent}List with {len(node)} items:")
+            for i, item in reversed(list(enumerate(node))):
+                stack.append(("node", item, level + 1))
+                stack.append(("emit", f"{indent}Item {i+1}:"))
+        else:
+            buf.append(f"{indent}{node}")
+    if buf:
+        sys.stdout.write("\n".join(buf) + "\n")
+
+# Name index per plist, keyed by id(). Builtin lists cannot be weak
+# referenced, so the plist itself is kept in the value and checked by
+# identity to guard against id() reuse; entries live for the session.
+_index_cache = {}
+
+def _iter_tty(interfaces):
+    """Lazily yield (interface, child, grandchild, tty) tuples; consumers
+    can break at the first hit without the rest of the subtrees ever
+    being walked"""
+    for interface in interfaces:
+        if type(interface) is not dict:
+            continue
+        for child in interface.get(_K_CHILDREN, []):
+            if type(child) is not dict:
+                continue
+            for gc in child.get(_K_CHILDREN, []):
+                if type(gc) is not dict:
+                    continue
+                yield interface, child, gc, gc.get(_K_TTY, None)
+
+# Everything any query needs, built in one pass over the interface list:
+# raw keeps the original list for the full listing, by_name resolves an
+# interface in O(1), tty_by_name resolves a TTY in O(1)
+_IndexedPlist = namedtuple("_IndexedPlist", "raw by_name tty_by_name")
+
+def _index(pl):
+    """Partition the interface list once (and reuse it) so K queries cost
+    N + K instead of K rescans of N interfaces"""
+    cached = _index_cache.get(id(pl))
+    if cached is not None and cached.raw is pl:
+        return cached
+    by_name = {}
+    tty_by_name = {}
+    for interface in pl:
+        if type(interface) is not dict:
+            continue
+        name = interface.get(_K_NAME, '')
+        is_data = interface.get(_K_CLASS) == 10
+        # CDC publishes a control and a data interface under the same
+        # name; only the data interface (class 10) carries the TTY, so
+        # prefer it when names collide
+        if name not in by_name or is_data:
+            by_name[name] = interface
+        if is_data and name not in tty_by_name:
+            tty = next((t for _i, _c, _g, t in _iter_tty([interface]) if t), None)
+            if tty:
+                tty_by_name[name] = tty
+    idx = _IndexedPlist(pl, by_name, tty_by_name)
+    _index_cache[id(pl)] = idx
+    return idx
+
+def _as_index(pl):
+    # Accept either a raw interface list or an already built index
+    return pl if type(pl) is _IndexedPlist else _index(pl)
 
 def find_tty_by_interface_name(pl, interface_name):
     """Find TTY device for a specific interface name"""
-    if not isinstance(pl, list):
+    if type(pl) is not list and type(pl) is not _IndexedPlist:
         print("Error: Expected a list at the top level")
         return None
-    
-    for interface in pl:
-        if not isinstance(interface, dict):
-            continue
-            
-        name = interface.get('IORegistryEntryName', '')
-        if name != interface_name:
-            continue
-            
-        # Look for data interfaces (class 10) with TTY devices
-        if interface.get('bInterfaceClass') == 10:
-            children = interface.get('IORegistryEntryChildren', [])
-            for child in children:
-                if not isinstance(child, dict):
-                    continue
-                    
-                grandchildren = child.get('IORegistryEntryChildren', [])
-                for gc in grandchildren:
-                    if not isinstance(gc, dict):
-                        continue
-                        
-                    tty_device = gc.get('IOTTYDevice', None)
-                    if tty_device:
-                        return tty_device
-    return None
+
+    return _as_index(pl).tty_by_name.get(interface_name)
+
+# Fixed fields of the per-interface listing, fetched in one itemgetter
+# call over a ChainMap that supplies the 'Unknown' defaults instead of a
+# .get(key, 'Unknown') per field. The Product/Vendor/Serial lines stay
+# conditional because they are omitted entirely when absent.
+_FIELD_KEYS = (_K_NAME, _K_CLASS, 'bInterfaceSubClass', 'bInterfaceProtocol',
+               'idVendor', 'idProduct', 'locationID')
+_GET_FIELDS = operator.itemgetter(*_FIELD_KEYS)
+_FIELD_DEFAULTS = dict.fromkeys(_FIELD_KEYS, 'Unknown')
+_IFACE_TMPL = ("Name: {}\n"
+               "Class: {}\n"
+               "SubClass: {}\n"
+               "Protocol: {}\n")
+_IDS_TMPL = ("Vendor ID: {}\n"
+             "Product ID: {}\n"
+             "Location ID: {}\n")
 
 def extract_usb_info(pl, interface_name=None):
-    """Extract useful information from the plist structure"""
-    if not isinstance(pl, list):
+    """Extract useful information from the plist structure (accepts a raw
+    interface list or an _IndexedPlist)"""
+    if type(pl) is not list and type(pl) is not _IndexedPlist:
         print("Error: Expected a list at the top level")
         return
-    
+    idx = _as_index(pl)
+
     # If interface_name is provided, only show TTY for that interface
     if interface_name:
-        tty_device = find_tty_by_interface_name(pl, interface_name)
+        tty_device = idx.tty_by_name.get(interface_name)
         if tty_device:
             print(f"TTY device for {interface_name}: {tty_device}")
         else:
             print(f"No TTY device found for interface: {interface_name}")
         return
-    
+
     # Otherwise show all interfaces
-    print(f"Found {len(pl)} USB interfaces")
-    
-    for i, interface in enumerate(pl):
-        if not isinstance(interface, dict):
-            print(f"\nInterface #{i+1} is not a dictionary, it's a {type(interface)}")
+    # The whole listing is buffered and written once at the end; when
+    # stdout feeds a pipe this avoids a flush per line
+    interfaces = idx.raw
+    parts = [f"Found {len(interfaces)} USB interfaces\n"]
+
+    for i, interface in enumerate(interfaces):
+        if type(interface) is not dict:
+            parts.append(f"\nInterface #{i+1} is not a dictionary, it's a {type(interface)}\n")
             continue
-            
-        print(f"\n--- USB Interface #{i+1} ---")
-        
-        # Basic info
-        name = interface.get('IORegistryEntryName', 'Unknown')
-        print(f"Name: {name}")
-        
-        # Interface details
-        print(f"Class: {interface.get('bInterfaceClass', 'Unknown')}")
-        print(f"SubClass: {interface.get('bInterfaceSubClass', 'Unknown')}")
-        print(f"Protocol: {interface.get('bInterfaceProtocol', 'Unknown')}")
-        
+
+        name, cls, sub, proto, vid, pid, loc = _GET_FIELDS(
+            ChainMap(interface, _FIELD_DEFAULTS))
+        parts.append(f"\n--- USB Interface #{i+1} ---\n")
+        parts.append(_IFACE_TMPL.format(name, cls, sub, proto))
+
         # Product info
         if 'USB Product Name' in interface:
-            print(f"Product: {interface['USB Product Name']}")
+            parts.append(f"Product: {interface['USB Product Name']}\n")
         if 'USB Vendor Name' in interface:
-            print(f"Vendor: {interface['USB Vendor Name']}")
+            parts.append(f"Vendor: {interface['USB Vendor Name']}\n")
         if 'USB Serial Number' in interface:
-            print(f"Serial: {interface['USB Serial Number']}")
-        
+            parts.append(f"Serial: {interface['USB Serial Number']}\n")
+
         # IDs
-        print(f"Vendor ID: {interface.get('idVendor', 'Unknown')}")
-        print(f"Product ID: {interface.get('idProduct', 'Unknown')}")
-        print(f"Location ID: {interface.get('locationID', 'Unknown')}")
-        
+        parts.append(_IDS_TMPL.format(vid, pid, loc))
+
         # Children
-        children = interface.get('IORegistryEntryChildren', [])
+        children = interface.get(_K_CHILDREN, [])
         if children:
-            print(f"\n  Children ({len(children)}):")
+            parts.append(f"\n  Children ({len(children)}):\n")
             for j, child in enumerate(children):
-                if not isinstance(child, dict):
-                    print(f"  Child #{j+1} is not a dictionary")
+                if type(child) is not dict:
+                    parts.append(f"  Child #{j+1} is not a dictionary\n")
                     continue
-                    
-                child_name = child.get('IORegistryEntryName', 'Unknown')
-                child_class = child.get('IOClass', 'Unknown')
-                print(f"  - Child #{j+1}: {child_name} (Class: {child_class})")
-                
+
+                child_name = child.get(_K_NAME, 'Unknown')
+                child_class = child.get(_K_IOCLASS, 'Unknown')
+                parts.append(f"  - Child #{j+1}: {child_name} (Class: {child_class})\n")
+
                 # Look for TTY devices in grandchildren
-                grandchildren = child.get('IORegistryEntryChildren', [])
+                grandchildren = child.get(_K_CHILDREN, [])
                 if grandchildren:
-                    print(f"    Grandchildren ({len(grandchildren)}):")
+                    parts.append(f"    Grandchildren ({len(grandchildren)}):\n")
                     for k, gc in enumerate(grandchildren):
-                        if not isinstance(gc, dict):
+                        if type(gc) is not dict:
                             continue
-                            
-                        gc_name = gc.get('IORegistryEntryName', 'Unknown')
-                        tty_device = gc.get('IOTTYDevice', None)
+
+                        gc_name = gc.get(_K_NAME, 'Unknown')
+                        tty_device = gc.get(_K_TTY, None)
                         if tty_device:
-                            print(f"    - #{k+1}: {gc_name} (TTY: {tty_device})")
+                            parts.append(f"    - #{k+1}: {gc_name} (TTY: {tty_device})\n")
                         else:
-                            print(f"    - #{k+1}: {gc_name}")
+                            parts.append(f"    - #{k+1}: {gc_name}\n")
+
+    sys.stdout.write("".join(parts))
 
-def main():
-    # Parse command line arguments
+def _build_parser():
     parser = argparse.ArgumentParser(description='USB Interface Information Tool',
                                      formatter_class=argparse.RawDescriptionHelpFormatter,
                                      epilog='''\
@@ -166,30 +490,46 @@ Example usage:
   usb-list.py -l --debug file.xml              # List all interfaces from file.xml
   usb-list.py "STM32 CDC ACM0"                 # Find TTY device for STM32 CDC ACM0
   usb-list.py "STM32 CDC ACM0" --debug usbio.xml  # Find TTY device from XML file
+  usb-list.py "STM32 CDC ACM0" "STM32 CDC ACM1"    # Resolve several interfaces in one run
 ''')
-    parser.add_argument('interface_name', nargs='?', 
-                      help='Name of the interface to find TTY device for (e.g., "STM32 CDC ACM0")')
+    parser.add_argument('interface_name', nargs='*', 
+                      help='Name(s) of the interface(s) to find TTY devices for (e.g., "STM32 CDC ACM0")')
     parser.add_argument('--list', '-l', action='store_true', 
                       help='List all interfaces with their details')
     parser.add_argument('--debug', metavar='XML_FILE',
                       help='Load data from the given XML file instead of running ioreg command')
-    args = parser.parse_args()
-    
+    parser.add_argument('--no-cache', action='store_true',
+                      help='Always re-run ioreg instead of reusing a recent cached dump')
+    return parser
+
+# Built once at import; callers that invoke main() repeatedly (e.g. a
+# reconnect loop) skip the parser construction cost on every call
+_PARSER = _build_parser()
+
+def main(argv=None):
+    # Parse command line arguments (argv lets callers invoke main()
+    # programmatically without re-launching the script)
+    args = _PARSER.parse_args(argv)
+
     if args.debug:
         print(f"Loading from file: {args.debug}")
         pl = load_from_file(args.debug)
     else:
         print("Getting data from ioreg command")
-        pl = get_usb_interfaces()
+        # A targeted lookup only ever inspects CDC data interfaces
+        cdc_only = bool(args.interface_name) and not args.list
+        pl = get_usb_interfaces(use_cache=not args.no_cache, cdc_only=cdc_only)
     if not pl:
         print("No data to process")
         return
     
-    # Process the data
+    # Process the data; the index is built once and serves every query
+    idx = _index(pl)
     if args.list or not args.interface_name:
-        extract_usb_info(pl)
+        extract_usb_info(idx)
     else:
-        extract_usb_info(pl, args.interface_name)
+        for name in args.interface_name:
+            extract_usb_info(idx, name)
 
 if __name__ == "__main__":
     main()